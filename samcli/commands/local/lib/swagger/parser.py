@@ -7,9 +7,14 @@ from samcli.local.apigw.local_apigw_service import Route
 
 LOG = logging.getLogger(__name__)
 
+_INTEGRATION_KEY = "x-amazon-apigateway-integration"
+_AWS_PROXY_INTEGRATION_TYPE = IntegrationType.aws_proxy.value
+_LAMBDA_AUTHORIZER_TYPES = frozenset((AuthorizerType.token.value, AuthorizerType.request.value))
+# Cached in place of an authorizer function name for security schemes that are referenced but never defined
+_UNDEFINED_SECURITY_SCHEME = object()
+
 
 class SwaggerParser:
-    _INTEGRATION_KEY = "x-amazon-apigateway-integration"
     _AUTHORIZER_KEY = "x-amazon-apigateway-authorizer"
     _ANY_METHOD_EXTENSION_KEY = "x-amazon-apigateway-any-method"
     _BINARY_MEDIA_TYPES_EXTENSION_KEY = "x-amazon-apigateway-binary-media-types"  # pylint: disable=C0103
@@ -66,21 +71,38 @@ class SwaggerParser:
         list of list of samcli.commands.local.apigw.local_apigw_service.Route
             List of APIs that are configured in the Swagger document
         """
+        return list(self._iter_routes(event_type))
+
+    def _iter_routes(self, event_type=Route.API):
+        """
+        Lazily parses the swagger document, yielding each configured route as soon as it is found.
+        See ``get_routes`` for the expected document structure.
 
-        result = []
+        Yields
+        ------
+        samcli.commands.local.apigw.local_apigw_service.Route
+            API that is configured in the Swagger document
+        """
         paths_dict = self.swagger.get("paths", {})
         components_dict = self.swagger.get("components", {})
-        security_dict = components_dict.get("securitySchemes", {})
+        security_dict = components_dict.get("securitySchemes")
+        if not isinstance(security_dict, dict):
+            security_dict = {}
+
+        # Security schemes are shared across routes, so each referenced scheme is resolved once and cached here
+        authorizer_names = {}
+
+        # Bound once up front since these are looked up for every method of every path
+        get_integration = self._get_integration
+        get_integration_function_name = self._get_integration_function_name
+        get_payload_format_version = self._get_payload_format_version
+        get_authorizers = self._get_authorizers
 
         for full_path, path_config in paths_dict.items():
             for method, method_config in path_config.items():
 
-                function_name = self._get_integration_function_name(method_config)
-                # TODO - Rewrite
-                authorizers = [
-                    {name: self._get_authorizer_function_name(security_dict[name]) for name, values in auth.items()}
-                    for auth in method_config.get("security", [])
-                ]
+                integration = get_integration(method_config)
+                function_name = get_integration_function_name(integration)
 
                 if not function_name:
                     LOG.debug(
@@ -90,22 +112,28 @@ class SwaggerParser:
                     )
                     continue
 
-                if method.lower() == self._ANY_METHOD_EXTENSION_KEY:
+                authorizers = [
+                    get_authorizers(auth, security_dict, authorizer_names, full_path, method)
+                    for auth in method_config.get("security", ())
+                ]
+
+                # Swagger keys are almost always lowercase already, so only fold the case when the exact match fails
+                if method == self._ANY_METHOD_EXTENSION_KEY or method.lower() == self._ANY_METHOD_EXTENSION_KEY:
                     # Convert to a more commonly used method notation
                     method = self._ANY_METHOD
-                payload_format_version = self._get_payload_format_version(method_config)
+                payload_format_version = get_payload_format_version(integration)
                 route = Route(
                     function_name,
                     full_path,
-                    methods=[method],
+                    methods=(method,),
                     event_type=event_type,
                     payload_format_version=payload_format_version,
                     authorizers=authorizers,
                 )
-                result.append(route)
-        return result
+                yield route
 
-    def _get_integration(self, method_config):
+    @staticmethod
+    def _get_integration(method_config):
         """
         Get Integration defined in the method configuration.
         Integration configuration is defined under the special "x-amazon-apigateway-integration" key. We care only
@@ -121,61 +149,106 @@ class SwaggerParser:
         dict or None
             integration, if possible. None, if not.
         """
-        if not isinstance(method_config, dict) or self._INTEGRATION_KEY not in method_config:
+        # Swagger documents are parsed into OrderedDicts, so dict subclasses must be accepted here
+        if not isinstance(method_config, dict):
             return None
 
-        integration = method_config[self._INTEGRATION_KEY]
+        integration = method_config.get(_INTEGRATION_KEY)
 
-        if integration and isinstance(integration, dict) and integration.get("type") == IntegrationType.aws_proxy.value:
+        if integration and isinstance(integration, dict) and integration.get("type") == _AWS_PROXY_INTEGRATION_TYPE:
             # Integration must be "aws_proxy" otherwise we don't care about it
             return integration
 
         return None
 
-    def _get_integration_function_name(self, method_config):
+    @staticmethod
+    def _get_integration_function_name(integration):
         """
-        Tries to parse the Lambda Function name from the Integration defined in the method configuration.
-        Integration configuration is defined under the special "x-amazon-apigateway-integration" key. We care only
-        about Lambda integrations, which are of type aws_proxy, and ignore the rest. Integration URI is complex and
-        hard to parse. Hence we do our best to extract function name out of integration URI. If not possible, we
-        return None.
+        Tries to parse the Lambda Function name from the Integration returned by ``_get_integration``.
+        Integration URI is complex and hard to parse. Hence we do our best to extract function name out of
+        integration URI. If not possible, we return None.
 
         Parameters
         ----------
-        method_config : dict
-            Dictionary containing the method configuration which might contain integration settings
+        integration : dict or None
+            Lambda integration of the method, as returned by ``_get_integration``
 
         Returns
         -------
         string or None
             Lambda function name, if possible. None, if not.
         """
-        integration = self._get_integration(method_config)
         if integration is None:
             return None
 
         return LambdaUri.get_function_name(integration.get("uri"))
 
-    def _get_payload_format_version(self, method_config):
+    @staticmethod
+    def _get_payload_format_version(integration):
         """
-        Get the "payloadFormatVersion" from the Integration defined in the method configuration.
+        Get the "payloadFormatVersion" from the Integration returned by ``_get_integration``.
 
         Parameters
         ----------
-        method_config : dict
-            Dictionary containing the method configuration which might contain integration settings
+        integration : dict or None
+            Lambda integration of the method, as returned by ``_get_integration``
 
         Returns
         -------
         string or None
             Payload format version, if exists. None, if not.
         """
-        integration = self._get_integration(method_config)
         if integration is None:
             return None
 
         return integration.get("payloadFormatVersion")
 
+    def _get_authorizers(self, security_requirement, security_dict, authorizer_names, full_path, method):
+        """
+        Resolves the Lambda Function names of the authorizers referenced by a security requirement of a method.
+        Schemes that are referenced but not defined under "securitySchemes" are skipped, with a warning logged the
+        first time each of them is referenced.
+
+        Parameters
+        ----------
+        security_requirement : dict
+            Security requirement of the method, keyed by security scheme name
+        security_dict : dict
+            Security schemes defined in the Swagger document, keyed by name
+        authorizer_names : dict
+            Cache of already resolved authorizer function names, keyed by security scheme name. Filled in place.
+        full_path : str
+            Path of the method, used for logging
+        method : str
+            Http method, used for logging
+
+        Returns
+        -------
+        dict
+            Authorizer function name (or None, if it could not be resolved), keyed by security scheme name
+        """
+        for name in security_requirement:
+            if name in authorizer_names:
+                continue
+
+            if name in security_dict:
+                authorizer_names[name] = self._get_authorizer_function_name(security_dict[name])
+            else:
+                LOG.warning(
+                    "Security scheme '%s' referenced at path='%s' method='%s' is not defined in the Swagger document. "
+                    "Routes referencing it will not invoke an authorizer for it.",
+                    name,
+                    full_path,
+                    method,
+                )
+                authorizer_names[name] = _UNDEFINED_SECURITY_SCHEME
+
+        return {
+            name: authorizer_names[name]
+            for name in security_requirement
+            if authorizer_names[name] is not _UNDEFINED_SECURITY_SCHEME
+        }
+
     def _get_authorizer_function_name(self, scheme_config):
         """
         Tries to parse the Lambda Function name from the authorizer defined in the method configuration.
@@ -194,19 +267,12 @@ class SwaggerParser:
         string or None
             Lambda function name, if possible. None, if not.
         """
-        if not isinstance(scheme_config, dict) or self._AUTHORIZER_KEY not in scheme_config:
+        if not isinstance(scheme_config, dict):
             return None
 
-        authorizer = scheme_config[self._AUTHORIZER_KEY]
+        authorizer = scheme_config.get(self._AUTHORIZER_KEY)
 
-        if (
-            authorizer
-            and isinstance(authorizer, dict)
-            and (
-                authorizer.get("type") == AuthorizerType.token.value
-                or authorizer.get("type") == AuthorizerType.request.value
-            )
-        ):
+        if authorizer and isinstance(authorizer, dict) and authorizer.get("type") in _LAMBDA_AUTHORIZER_TYPES:
             # authorizer must be "request" or "token" otherwise we don't care about it
             return LambdaUri.get_function_name(authorizer.get("authorizerUri"))
 
@@ -51,7 +51,7 @@ class Route:
         """
         Creates an ApiGatewayRoute
 
-        :param list(str) methods: http method
+        :param iterable(str) methods: http methods. Any iterable of str is accepted; it is copied into a new list
         :param function_name: Name of the Lambda function this API is connected to
         :param str path: Path off the base url
         :param str event_type: Type of the event. "Api" or "HttpApi"
@@ -86,7 +86,7 @@ class Route:
         Normalizes Http Methods. Api Gateway allows a Http Methods of ANY. This is a special verb to denote all
         supported Http Methods on Api Gateway.
 
-        :param list methods: Http methods
+        :param iterable(str) methods: Http methods. Only iterated over, never mutated or kept
         :return list: Either the input http_method or one of the _ANY_HTTP_METHODS (normalized Http Methods)
         """
         methods = [method.upper() for method in methods]
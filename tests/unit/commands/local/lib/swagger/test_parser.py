@@ -1,6 +1,8 @@
 """
 Test the swagger parser
 """
+import json
+from collections import OrderedDict
 from unittest import TestCase
 
 from unittest.mock import patch, Mock
@@ -25,9 +27,7 @@ class TestSwaggerParser_get_apis(TestCase):
         result = parser.get_routes()
 
         self.assertEqual(expected, result)
-        parser._get_integration_function_name.assert_called_with(
-            {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}
-        )
+        parser._get_integration_function_name.assert_called_with({"type": "aws_proxy", "uri": "someuri"})
 
     def test_with_combination_of_paths_methods(self):
         function_name = "myfunction"
@@ -54,15 +54,17 @@ class TestSwaggerParser_get_apis(TestCase):
 
         self.assertEqual(expected, set(result))
 
-    def test_with_any_method(self):
+    @parameterized.expand(
+        [
+            param("lowercase extension key", "x-amazon-apigateway-any-method"),
+            param("mixed case extension key", "X-Amazon-Apigateway-Any-Method"),
+        ]
+    )
+    def test_with_any_method(self, test_case_name, any_method_key):
         function_name = "myfunction"
         swagger = {
             "paths": {
-                "/path1": {
-                    "x-amazon-apigateway-any-method": {
-                        "x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}
-                    }
-                }
+                "/path1": {any_method_key: {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}}
             }
         }
 
@@ -75,6 +77,37 @@ class TestSwaggerParser_get_apis(TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_iter_routes_yields_routes_lazily(self):
+        function_name = "myfunction"
+        swagger = {
+            "paths": {"/path1": {"get": {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}}}
+        }
+
+        parser = SwaggerParser(swagger)
+        parser._get_integration_function_name = Mock()
+        parser._get_integration_function_name.return_value = function_name
+
+        routes = parser._iter_routes()
+
+        parser._get_integration_function_name.assert_not_called()
+        self.assertEqual(Route(path="/path1", methods=["get"], function_name=function_name), next(routes))
+        self.assertIsNone(next(routes, None))
+
+    def test_with_ordered_dict_swagger(self):
+        # SwaggerReader loads documents into OrderedDicts
+        integration = {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}
+        swagger = json.loads(json.dumps({"paths": {"/path1": {"get": integration}}}), object_pairs_hook=OrderedDict)
+        self.assertIsInstance(swagger["paths"]["/path1"]["get"], OrderedDict)
+
+        parser = SwaggerParser(swagger)
+        parser._get_integration_function_name = Mock()
+        parser._get_integration_function_name.return_value = "myfunction"
+
+        expected = [Route(path="/path1", methods=["get"], function_name="myfunction")]
+        result = parser.get_routes()
+
+        self.assertEqual(expected, result)
+
     def test_does_not_have_function_name(self):
         swagger = {
             "paths": {"/path1": {"post": {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}}}
@@ -110,6 +143,79 @@ class TestSwaggerParser_get_apis(TestCase):
         parser._get_authorizer_function_name.assert_called_with(
             { "x-amazon-apigateway-authorizer": { "type": "request", "authorizerUri": "someuri" }})
 
+    def test_security_scheme_resolved_once_for_all_routes(self):
+        auth_function_name = "authfunction"
+        integration = {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}
+        swagger = {
+            "paths": {
+                "/path1": {"get": dict(integration, security=[{"customAuthorizer": []}])},
+                "/path2": {"post": dict(integration, security=[{"customAuthorizer": []}])},
+            },
+            "components": {
+                "securitySchemes": {
+                    "customAuthorizer": {
+                        "x-amazon-apigateway-authorizer": {"type": "request", "authorizerUri": "someuri"}
+                    },
+                    "unusedAuthorizer": {
+                        "x-amazon-apigateway-authorizer": {"type": "token", "authorizerUri": "otheruri"}
+                    },
+                }
+            },
+        }
+
+        parser = SwaggerParser(swagger)
+        parser._get_integration_function_name = Mock()
+        parser._get_integration_function_name.return_value = "myfunction"
+        parser._get_authorizer_function_name = Mock()
+        parser._get_authorizer_function_name.return_value = auth_function_name
+
+        result = parser.get_routes()
+
+        self.assertEqual(2, len(result))
+        parser._get_authorizer_function_name.assert_called_once_with(
+            {"x-amazon-apigateway-authorizer": {"type": "request", "authorizerUri": "someuri"}}
+        )
+
+    def test_security_schemes_is_null(self):
+        swagger = {
+            "paths": {"/path1": {"get": {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}}},
+            "components": {"securitySchemes": None},
+        }
+
+        parser = SwaggerParser(swagger)
+        parser._get_integration_function_name = Mock()
+        parser._get_integration_function_name.return_value = "myfunction"
+
+        result = parser.get_routes()
+
+        self.assertEqual([Route(path="/path1", methods=["get"], function_name="myfunction")], result)
+
+    def test_security_scheme_not_defined(self):
+        integration = {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}
+        swagger = {
+            "paths": {
+                "/path1": {"get": dict(integration, security=[{"undefinedAuthorizer": []}])},
+                "/path2": {"post": dict(integration, security=[{"undefinedAuthorizer": []}])},
+            },
+        }
+
+        parser = SwaggerParser(swagger)
+        parser._get_integration_function_name = Mock()
+        parser._get_integration_function_name.return_value = "myfunction"
+
+        with self.assertLogs("samcli.commands.local.lib.swagger.parser", level="WARNING") as logs:
+            result = parser.get_routes()
+
+        expected = [
+            Route(path="/path1", methods=["get"], function_name="myfunction"),
+            Route(path="/path2", methods=["post"], function_name="myfunction"),
+        ]
+        self.assertEqual(expected, result)
+        self.assertEqual([[{}], [{}]], [route.authorizers for route in result])
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("'undefinedAuthorizer'", logs.output[0])
+        self.assertIn("path='/path1' method='get'", logs.output[0])
+
     def test_multiple_security_scheme_configured(self):
         pass
     
@@ -218,7 +324,7 @@ class TestSwaggerParser_get_integration_function_name(TestCase):
         method_config = {"x-amazon-apigateway-integration": {"type": "aws_proxy", "uri": "someuri"}}
 
         parser = SwaggerParser({})
-        result = parser._get_integration_function_name(method_config)
+        result = parser._get_integration_function_name(parser._get_integration(method_config))
 
         self.assertEqual(function_name, result)
         LambdaUriMock.get_function_name.assert_called_with("someuri")
@@ -238,11 +344,29 @@ class TestSwaggerParser_get_integration_function_name(TestCase):
         LambdaUriMock.get_function_name.return_value = None
 
         parser = SwaggerParser({})
-        result = parser._get_integration_function_name(method_config)
+        result = parser._get_integration_function_name(parser._get_integration(method_config))
 
         self.assertIsNone(result, "must not parse invalid integration")
 
 
+class TestSwaggerParser_get_payload_format_version(TestCase):
+    @parameterized.expand(
+        [
+            param("integration is None", None, None),
+            param("payload format version is absent", {"type": "aws_proxy", "uri": "someuri"}, None),
+            param(
+                "payload format version is present",
+                {"type": "aws_proxy", "uri": "someuri", "payloadFormatVersion": "2.0"},
+                "2.0",
+            ),
+        ]
+    )
+    def test_payload_format_version(self, test_case_name, integration, expected_result):
+        parser = SwaggerParser({})
+
+        self.assertEqual(parser._get_payload_format_version(integration), expected_result)
+
+
 class TestSwaggerParser_get_binary_media_types(TestCase):
     @parameterized.expand(
         [